@@ -5,14 +5,29 @@ Serena Dashboard - Web interface for monitoring and managing Serena agents
 
 import os
 import sys
+import gzip
 import json
+import time
+import hashlib
+import itertools
+import collections
+import mimetypes
 import logging
+import logging.handlers
+import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
+import brotli
+import orjson
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask, Response, render_template, jsonify, request
+from flask_compress import Compress
 from flask_cors import CORS
+from flask_orjson import OrjsonProvider
+from werkzeug.security import safe_join
 
 # Add the src directory to the Python path
 src_path = Path(__file__).parent / "src"
@@ -24,28 +39,66 @@ try:
     from serena import serena_version
 except ImportError:
     # Fallback if serena is not installed
-    class MemoryLogHandler:
-        def __init__(self):
-            self.logs = []
-        
+    class MemoryLogHandler(logging.Handler):
+        """Keeps the most recent log records, pre-formatted for the API, in a fixed-size ring buffer."""
+
+        def __init__(self, max_logs: int = 1000):
+            super().__init__()
+            self.logs = collections.deque(maxlen=max_logs)
+
+        def emit(self, record):
+            try:
+                self.logs.append({
+                    "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+                    "level": record.levelname,
+                    "logger": record.name,
+                    "message": record.getMessage()
+                })
+            except Exception:
+                # like the stdlib handlers, report e.g. malformed format arguments instead of raising into the caller
+                self.handleError(record)
+
         def get_logs(self):
-            return self.logs
+            return list(self.logs)
+
+        def get_recent(self, n: int):
+            return list(itertools.islice(self.logs, max(0, len(self.logs) - n), None))
     
     def serena_version():
         return "0.1.4"
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Configure logging; console records are buffered and written in batches, errors are flushed immediately
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+_buffered_log_handler = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=_log_stream_handler
 )
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(_buffered_log_handler)
 
 logger = logging.getLogger(__name__)
 
-# Create Flask app
+# Debug mode (auto-reloading of code and templates) is opt-in via SERENA_DEBUG=1
+DEBUG = os.environ.get('SERENA_DEBUG') == '1'
+
+DASHBOARD_DIR = Path(__file__).parent / 'dashboard'
+
+# Create Flask app; static files are served by `static_files` below rather than Flask's built-in handler
 app = Flask(__name__, 
            template_folder='dashboard/templates',
-           static_folder='dashboard/static')
+           static_folder=None)
+# Serialize API responses with orjson instead of the stdlib json encoder
+app.json = OrjsonProvider(app)
+app.config['TEMPLATES_AUTO_RELOAD'] = DEBUG
+app.jinja_env.auto_reload = DEBUG
+app.jinja_env.cache_size = 400
+# Compress dynamic responses; static assets are served from precompressed sidecars instead
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_MIN_SIZE'] = 500
+Compress(app)
 CORS(app)
 
 # Global memory log handler
@@ -97,82 +150,199 @@ SAMPLE_PROJECTS = [
     }
 ]
 
+# The sample data never changes at runtime, so these bodies are serialized once
+_AGENTS_BYTES = orjson.dumps({"agents": SAMPLE_AGENTS, "total": len(SAMPLE_AGENTS)})
+_PROJECTS_BYTES = orjson.dumps({"projects": SAMPLE_PROJECTS, "total": len(SAMPLE_PROJECTS)})
+_AGENTS_ETAG = hashlib.blake2b(_AGENTS_BYTES, digest_size=8).hexdigest()
+_PROJECTS_ETAG = hashlib.blake2b(_PROJECTS_BYTES, digest_size=8).hexdigest()
+
+# Shown by /api/logs while no real log records have been captured yet
+_STARTUP_TIMESTAMP = datetime.now().isoformat()
+SAMPLE_LOGS = [
+    {
+        "timestamp": _STARTUP_TIMESTAMP,
+        "level": "INFO",
+        "logger": "serena.dashboard",
+        "message": "Dashboard started successfully"
+    },
+    {
+        "timestamp": _STARTUP_TIMESTAMP,
+        "level": "INFO",
+        "logger": "serena.agent",
+        "message": "Agent initialized with default configuration"
+    },
+    {
+        "timestamp": _STARTUP_TIMESTAMP,
+        "level": "DEBUG",
+        "logger": "serena.mcp",
+        "message": "MCP server ready to accept connections"
+    }
+]
+_SAMPLE_LOGS_BYTES = orjson.dumps({"logs": SAMPLE_LOGS, "total": len(SAMPLE_LOGS)})
+
+# Time-dependent bodies are rebuilt at most once per TTL and shared between requests
+RESPONSE_CACHE_TTL = 1.0
+_status_cache = {"ts": 0.0, "data": {}, "body": b""}
+_metrics_cache = {"ts": 0.0, "data": {}, "body": b""}
+_cache_lock = threading.Lock()
+
+
+def _json_response(body: bytes) -> Response:
+    """Wrap an already serialized JSON body in a response."""
+    return Response(body, mimetype="application/json")
+
+
+def _static_json_response(body: bytes, etag: str) -> Response:
+    """
+    Respond with a JSON body that never changes at runtime, honouring If-None-Match.
+
+    :param body: Serialized JSON body
+    :param etag: ETag of the body (unquoted)
+    :return: The JSON response or an empty 304 response if the client's copy is current
+    """
+    headers = {'Cache-Control': 'public, max-age=30', 'ETag': f'"{etag}"'}
+    if etag in request.if_none_match:
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype="application/json", headers=headers)
+
+
+def _refresh_cache(cache: Dict[str, Any], build) -> Dict[str, Any]:
+    """
+    Rebuild the cached data and its serialized body if they are older than the TTL.
+
+    :param cache: Cache entry holding the data, its serialized body and the time it was built
+    :param build: Callable returning the dict to cache
+    :return: The (possibly refreshed) cache entry
+    """
+    now = time.monotonic()
+    if now - cache["ts"] > RESPONSE_CACHE_TTL:
+        with _cache_lock:
+            if now - cache["ts"] > RESPONSE_CACHE_TTL:
+                data = build()
+                cache["body"] = orjson.dumps(data)
+                cache["data"] = data
+                cache["ts"] = now
+    return cache
+
+
+def _status_dict() -> Dict[str, Any]:
+    """Build the system status shared by /api/status and /api/overview."""
+    return {
+        "status": "running",
+        "version": serena_version(),
+        "timestamp": datetime.now().isoformat(),
+        "agents_count": len(SAMPLE_AGENTS),
+        "projects_count": len(SAMPLE_PROJECTS)
+    }
+
+
+# content encoding -> suffix of the precompressed sidecar file, in order of preference
+PRECOMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def _precompress(data: bytes) -> Dict[str, bytes]:
+    """
+    :param data: Response body
+    :return: the body by content encoding ('identity' and those of PRECOMPRESSED_SUFFIXES)
+    """
+    return {'identity': data, 'br': brotli.compress(data, quality=11), 'gzip': gzip.compress(data, 9)}
+
+
+def _encoded_response(bodies: Dict[str, bytes], mimetype: str, headers: Dict[str, str]) -> Response:
+    """
+    Respond with the preferred precompressed body the client accepts; such responses are not compressed again
+    by Flask-Compress, since they already have a Content-Encoding.
+
+    :param bodies: Bodies by content encoding, including 'identity'
+    :param mimetype: Mimetype of the response
+    :param headers: Response headers; Content-Encoding is added if a compressed body is chosen
+    :return: Response
+    """
+    for encoding in PRECOMPRESSED_SUFFIXES:
+        if encoding in bodies and request.accept_encodings[encoding]:
+            headers['Content-Encoding'] = encoding
+            return Response(bodies[encoding], mimetype=mimetype, headers=headers)
+    return Response(bodies['identity'], mimetype=mimetype, headers=headers)
+
+
+PAGE_TEMPLATES = ('index.html', 'dashboard.html')
+
+# template name -> rendered and precompressed HTML by content encoding;
+# the pages take no input, so they are rendered and compressed once unless debugging
+_rendered_pages: Dict[str, Dict[str, bytes]] = {}
+
+
+def _render_page(template_name: str) -> Response:
+    """
+    Render an input-free page template, reusing the previously rendered and compressed HTML.
+
+    :param template_name: Name of the template to render
+    :return: HTML response
+    """
+    bodies = _rendered_pages.get(template_name)
+    if bodies is None:
+        html = render_template(template_name, asset_version=ASSET_VERSION)
+        if DEBUG:
+            return Response(html, mimetype='text/html')
+        bodies = _rendered_pages[template_name] = _precompress(html.encode())
+    return _encoded_response(bodies, 'text/html', {'Vary': 'Accept-Encoding'})
+
+
+def precompile_templates() -> None:
+    """
+    Parse the page templates ahead of the first request and, unless debugging, render and compress them as well.
+    """
+    with app.app_context():
+        for template_name in PAGE_TEMPLATES:
+            app.jinja_env.get_template(template_name)
+            if not DEBUG:
+                html = render_template(template_name, asset_version=ASSET_VERSION)
+                _rendered_pages[template_name] = _precompress(html.encode())
+
 
 @app.route('/')
 def index():
     """Main dashboard page."""
-    return render_template('index.html')
+    return _render_page('index.html')
 
 
 @app.route('/dashboard/')
 def dashboard():
     """Dashboard page."""
-    return render_template('dashboard.html')
+    return _render_page('dashboard.html')
 
 
 @app.route('/api/status')
 def api_status():
     """Get system status."""
-    return jsonify({
-        "status": "running",
-        "version": serena_version(),
-        "timestamp": datetime.now().isoformat(),
-        "agents_count": len(SAMPLE_AGENTS),
-        "projects_count": len(SAMPLE_PROJECTS)
-    })
+    return _json_response(_refresh_cache(_status_cache, _status_dict)["body"])
 
 
 @app.route('/api/agents')
 def api_agents():
     """Get list of agents."""
-    return jsonify({
-        "agents": SAMPLE_AGENTS,
-        "total": len(SAMPLE_AGENTS)
-    })
+    return _static_json_response(_AGENTS_BYTES, _AGENTS_ETAG)
 
 
 @app.route('/api/projects')
 def api_projects():
     """Get list of projects."""
-    return jsonify({
-        "projects": SAMPLE_PROJECTS,
-        "total": len(SAMPLE_PROJECTS)
-    })
+    return _static_json_response(_PROJECTS_BYTES, _PROJECTS_ETAG)
 
 
 @app.route('/api/logs')
 def api_logs():
     """Get recent logs."""
     try:
-        logs = memory_handler.get_logs()
+        logs = memory_handler.get_recent(100)
         
-        # Add some sample logs if none exist
+        # Serve the sample logs if none exist
         if not logs:
-            sample_logs = [
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "logger": "serena.dashboard",
-                    "message": "Dashboard started successfully"
-                },
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "logger": "serena.agent",
-                    "message": "Agent initialized with default configuration"
-                },
-                {
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "DEBUG",
-                    "logger": "serena.mcp",
-                    "message": "MCP server ready to accept connections"
-                }
-            ]
-            logs = sample_logs
+            return _json_response(_SAMPLE_LOGS_BYTES)
         
         return jsonify({
-            "logs": logs[-100:],  # Return last 100 logs
-            "total": len(logs)
+            "logs": logs,
+            "total": len(memory_handler.logs)
         })
     except Exception as e:
         logger.error(f"Error fetching logs: {e}")
@@ -185,7 +355,7 @@ def api_logs():
 @app.route('/api/metrics')
 def api_metrics():
     """Get system metrics."""
-    return jsonify({
+    return _json_response(_refresh_cache(_metrics_cache, lambda: {
         "cpu_usage": 25.5,
         "memory_usage": 45.2,
         "disk_usage": 60.1,
@@ -195,29 +365,133 @@ def api_metrics():
         },
         "uptime": "2h 30m",
         "timestamp": datetime.now().isoformat()
+    })["body"])
+
+
+@app.route('/api/overview')
+def api_overview():
+    """Get status, agents, projects and recent logs in a single response."""
+    return jsonify({
+        "status": _refresh_cache(_status_cache, _status_dict)["data"],
+        "agents": SAMPLE_AGENTS,
+        "projects": SAMPLE_PROJECTS,
+        "logs": memory_handler.get_recent(100) or SAMPLE_LOGS
     })
 
 
+STATIC_DIR = DASHBOARD_DIR / 'static'
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# normalized path -> (etag, {content encoding: body}, mimetype) of existing assets;
+# static assets do not change while the server is running
+_static_assets: Dict[str, Tuple[str, Dict[str, bytes], str]] = {}
+
+
+# the process umask, applied to files written by _write_file_atomic (read once, since it can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """
+    Write a file via a uniquely named temporary file that replaces it, such that concurrent readers
+    (e.g. other server workers) never see partially written content.
+
+    :param path: Path of the file
+    :param data: Content to write
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_precompressed_sidecars(static_dir: Path) -> None:
+    """
+    Write `.br` and `.gz` sidecars next to every static asset whose sidecars are missing or stale.
+
+    :param static_dir: Directory containing the static assets
+    """
+    for path in static_dir.rglob('*'):
+        if not path.is_file() or path.suffix in PRECOMPRESSED_SUFFIXES.values():
+            continue
+        mtime = path.stat().st_mtime_ns
+        data = None
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            sidecar = path.with_name(path.name + suffix)
+            if sidecar.exists() and sidecar.stat().st_mtime_ns >= mtime:
+                continue
+            if data is None:
+                data = path.read_bytes()
+            if encoding == 'br':
+                _write_file_atomic(sidecar, brotli.compress(data, quality=11))
+            else:
+                _write_file_atomic(sidecar, gzip.compress(data, 9))
+
+
+def _load_static_asset(filename: str) -> Optional[Tuple[str, Dict[str, bytes], str]]:
+    """
+    Read a static asset along with its precompressed sidecars and compute its ETag, caching the result.
+
+    :param filename: Path of the asset relative to the static directory
+    :return: Tuple of (etag, bodies by content encoding, mimetype) or None if the asset does not exist
+    """
+    path = safe_join(str(STATIC_DIR), filename)
+    if path is None:
+        return None
+    # keyed on the normalized path, such that aliases of an asset (e.g. `./x.js`) share one entry
+    path = os.path.normpath(path)
+    asset = _static_assets.get(path)
+    if asset is not None:
+        return asset
+    try:
+        st = os.stat(path)
+        with open(path, 'rb') as f:
+            bodies = {'identity': f.read()}
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+        try:
+            if os.stat(path + suffix).st_mtime_ns >= st.st_mtime_ns:
+                with open(path + suffix, 'rb') as f:
+                    bodies[encoding] = f.read()
+        except FileNotFoundError:
+            pass
+    # the ETag is derived from the original content only, so all encodings share it
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    asset = _static_assets[path] = (etag, bodies, mimetype)
+    return asset
+
+
 @app.route('/static/<path:filename>')
 def static_files(filename):
-    """Serve static files."""
-    return send_from_directory('dashboard/static', filename)
+    """Serve static files from memory with long-lived cache headers."""
+    asset = _load_static_asset(filename)
+    if asset is None:
+        return Response(status=404)
+    etag, bodies, mimetype = asset
+    headers = {'Cache-Control': STATIC_CACHE_CONTROL, 'ETag': etag, 'Vary': 'Accept-Encoding'}
+    if etag.strip('"') in request.if_none_match:
+        return Response(status=304, headers=headers)
+    return _encoded_response(bodies, mimetype, headers)
 
 
-if __name__ == '__main__':
-    # Ensure dashboard directories exist
-    dashboard_dir = Path('dashboard')
-    templates_dir = dashboard_dir / 'templates'
-    static_dir = dashboard_dir / 'static'
-    
-    templates_dir.mkdir(parents=True, exist_ok=True)
-    static_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create basic templates if they don't exist
-    index_template = templates_dir / 'index.html'
-    if not index_template.exists():
-        with open(index_template, 'w') as f:
-            f.write('''
+# ASGI entry point, e.g. for `gunicorn -k uvicorn.workers.UvicornWorker run_dashboard:asgi_app`
+asgi_app = WsgiToAsgi(app)
+
+
+# Dashboard page templates and static assets, written to DASHBOARD_DIR by `setup_dashboard_assets`
+INDEX_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -274,12 +548,9 @@ if __name__ == '__main__':
     </script>
 </body>
 </html>
-            ''')
-    
-    dashboard_template = templates_dir / 'dashboard.html'
-    if not dashboard_template.exists():
-        with open(dashboard_template, 'w') as f:
-            f.write('''
+            '''
+
+DASHBOARD_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -338,86 +609,84 @@ if __name__ == '__main__':
         </div>
     </div>
     
-    <script src="/static/dashboard.js"></script>
+    <script src="/static/dashboard.js?v={{ asset_version }}"></script>
 </body>
 </html>
-            ''')
-    
-    # Create dashboard.js
-    js_file = static_dir / 'dashboard.js'
-    if not js_file.exists():
-        with open(js_file, 'w') as f:
-            f.write('''
+            '''
+
+DASHBOARD_JS = '''
 // Dashboard JavaScript
 console.log('Dashboard JavaScript loaded');
 
-// Load system status
-function loadSystemStatus() {
-    console.log('Loading system status...');
-    fetch('/api/status')
-        .then(response => {
-            console.log('Status response:', response);
-            return response.json();
-        })
-        .then(data => {
-            console.log('Status data:', data);
-            document.getElementById('system-status').innerHTML = `
-                <p><strong>Status:</strong> <span class="status active">${data.status}</span></p>
-                <p><strong>Version:</strong> ${data.version}</p>
-                <p><strong>Agents:</strong> ${data.agents_count}</p>
-                <p><strong>Projects:</strong> ${data.projects_count}</p>
-                <p><strong>Last Updated:</strong> ${new Date(data.timestamp).toLocaleString()}</p>
-            `;
-        })
-        .catch(error => {
-            console.error('Error loading system status:', error);
-            document.getElementById('system-status').innerHTML = '<p style="color: red;">Error loading status</p>';
-        });
+// Render system status
+function renderSystemStatus(data) {
+    document.getElementById('system-status').innerHTML = `
+        <p><strong>Status:</strong> <span class="status active">${data.status}</span></p>
+        <p><strong>Version:</strong> ${data.version}</p>
+        <p><strong>Agents:</strong> ${data.agents_count}</p>
+        <p><strong>Projects:</strong> ${data.projects_count}</p>
+        <p><strong>Last Updated:</strong> ${new Date(data.timestamp).toLocaleString()}</p>
+    `;
 }
 
-// Load agents
-function loadAgents() {
-    console.log('Loading agents...');
-    fetch('/api/agents')
-        .then(response => response.json())
-        .then(data => {
-            console.log('Agents data:', data);
-            const agentsList = data.agents.map(agent => `
-                <div style="margin-bottom: 1rem; padding: 0.75rem; border: 1px solid #dee2e6; border-radius: 4px;">
-                    <strong>${agent.name}</strong>
-                    <span class="status ${agent.status}">${agent.status}</span>
-                    <br><small>Project: ${agent.project}</small>
-                    <br><small>Modes: ${agent.modes.join(', ')}</small>
-                </div>
-            `).join('');
-            document.getElementById('agents-list').innerHTML = agentsList || '<p>No agents found</p>';
-        })
-        .catch(error => {
-            console.error('Error loading agents:', error);
-            document.getElementById('agents-list').innerHTML = '<p style="color: red;">Error loading agents</p>';
-        });
+// Render agents
+function renderAgents(agents) {
+    const agentsList = agents.map(agent => `
+        <div style="margin-bottom: 1rem; padding: 0.75rem; border: 1px solid #dee2e6; border-radius: 4px;">
+            <strong>${agent.name}</strong>
+            <span class="status ${agent.status}">${agent.status}</span>
+            <br><small>Project: ${agent.project}</small>
+            <br><small>Modes: ${agent.modes.join(', ')}</small>
+        </div>
+    `).join('');
+    document.getElementById('agents-list').innerHTML = agentsList || '<p>No agents found</p>';
+}
+
+// Render projects
+function renderProjects(projects) {
+    const projectsList = projects.map(project => `
+        <div style="margin-bottom: 1rem; padding: 0.75rem; border: 1px solid #dee2e6; border-radius: 4px;">
+            <strong>${project.name}</strong>
+            <span class="status ${project.status}">${project.status}</span>
+            <br><small>Language: ${project.language}</small>
+            <br><small>Agents: ${project.agents_count}</small>
+        </div>
+    `).join('');
+    document.getElementById('projects-list').innerHTML = projectsList || '<p>No projects found</p>';
+}
+
+// Render logs
+function renderLogs(logs) {
+    const logEntries = logs.map(log => `
+        <div class="log-entry">
+            <span class="log-level ${log.level}">${log.level}</span>
+            <span style="color: #6c757d;">${new Date(log.timestamp).toLocaleTimeString()}</span>
+            <span style="color: #495057;">${log.logger}</span>
+            <br>
+            <span>${log.message}</span>
+        </div>
+    `).join('');
+    document.getElementById('logs-container').innerHTML = logEntries || '<p>No logs available</p>';
 }
 
-// Load projects
-function loadProjects() {
-    console.log('Loading projects...');
-    fetch('/api/projects')
+// Load status, agents, projects and logs with a single request
+function loadOverview() {
+    console.log('Loading overview...');
+    fetch('/api/overview')
         .then(response => response.json())
         .then(data => {
-            console.log('Projects data:', data);
-            const projectsList = data.projects.map(project => `
-                <div style="margin-bottom: 1rem; padding: 0.75rem; border: 1px solid #dee2e6; border-radius: 4px;">
-                    <strong>${project.name}</strong>
-                    <span class="status ${project.status}">${project.status}</span>
-                    <br><small>Language: ${project.language}</small>
-                    <br><small>Agents: ${project.agents_count}</small>
-                </div>
-            `).join('');
-            document.getElementById('projects-list').innerHTML = projectsList || '<p>No projects found</p>';
+            console.log('Overview data:', data);
+            renderSystemStatus(data.status);
+            renderAgents(data.agents);
+            renderProjects(data.projects);
+            renderLogs(data.logs);
         })
         .catch(error => {
-            console.error('Error loading projects:', error);
-            document.getElementById('projects-list').innerHTML = '<p style="color: red;">Error loading projects</p>';
+            console.error('Error loading overview:', error);
+            const errorHtml = '<p style="color: red;">Error loading data</p>';
+            ['system-status', 'agents-list', 'projects-list', 'logs-container'].forEach(id => {
+                document.getElementById(id).innerHTML = errorHtml;
+            });
         });
 }
 
@@ -425,28 +694,14 @@ function loadProjects() {
 function loadLogs() {
     console.log('Loading logs...');
     fetch('/api/logs')
-        .then(response => {
-            console.log('Logs response:', response);
-            return response.json();
-        })
+        .then(response => response.json())
         .then(data => {
             console.log('Logs data:', data);
             if (data.error) {
                 document.getElementById('logs-container').innerHTML = `<p style="color: red;">Error: ${data.error}</p>`;
                 return;
             }
-            
-            const logEntries = data.logs.map(log => `
-                <div class="log-entry">
-                    <span class="log-level ${log.level}">${log.level}</span>
-                    <span style="color: #6c757d;">${new Date(log.timestamp).toLocaleTimeString()}</span>
-                    <span style="color: #495057;">${log.logger}</span>
-                    <br>
-                    <span>${log.message}</span>
-                </div>
-            `).join('');
-            
-            document.getElementById('logs-container').innerHTML = logEntries || '<p>No logs available</p>';
+            renderLogs(data.logs);
         })
         .catch(error => {
             console.error('Error loading logs:', error);
@@ -457,17 +712,10 @@ function loadLogs() {
 // Initialize dashboard
 function initDashboard() {
     console.log('Initializing dashboard...');
-    loadSystemStatus();
-    loadAgents();
-    loadProjects();
-    loadLogs();
+    loadOverview();
     
     // Set up periodic refresh
-    setInterval(() => {
-        loadSystemStatus();
-        loadAgents();
-        loadProjects();
-    }, 30000); // Refresh every 30 seconds
+    setInterval(loadOverview, 30000); // Refresh every 30 seconds
 }
 
 // Initialize when page loads
@@ -477,13 +725,60 @@ document.addEventListener('DOMContentLoaded', initDashboard);
 window.addEventListener('error', function(e) {
     console.error('JavaScript error:', e.error);
 });
-            ''')
-    
+            '''
+
+# Version of dashboard.js, appended as a query string to bust browser caches when the script changes
+ASSET_VERSION = hashlib.blake2b(DASHBOARD_JS.encode(), digest_size=8).hexdigest()
+_ASSETS_HASH = hashlib.blake2b((INDEX_HTML + DASHBOARD_HTML + DASHBOARD_JS).encode(), digest_size=8).hexdigest()
+_BUILD_MARKER = DASHBOARD_DIR / '.built-v1'
+# path -> content of the files written by setup_dashboard_assets
+_BUILT_FILES = {
+    DASHBOARD_DIR / 'templates' / 'index.html': INDEX_HTML,
+    DASHBOARD_DIR / 'templates' / 'dashboard.html': DASHBOARD_HTML,
+    STATIC_DIR / 'dashboard.js': DASHBOARD_JS,
+}
+
+
+def setup_dashboard_assets() -> None:
+    """
+    Write the dashboard templates, static assets and their precompressed sidecars.
+    All files are replaced atomically, such that server workers running this concurrently on import
+    only ever read complete files.
+    This is skipped if the build marker shows that the current assets have already been written
+    and none of them has been deleted since.
+    """
+    try:
+        if _BUILD_MARKER.read_text() == _ASSETS_HASH and all(path.is_file() for path in _BUILT_FILES):
+            return
+    except FileNotFoundError:
+        pass
+
+    for path, content in _BUILT_FILES.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_file_atomic(path, content.encode())
+    write_precompressed_sidecars(STATIC_DIR)
+
+    _write_file_atomic(_BUILD_MARKER, _ASSETS_HASH.encode())
+    logger.info(f"Wrote dashboard assets to {DASHBOARD_DIR}")
+
+
+# Prepared on import, such that ASGI servers importing `asgi_app` (e.g. gunicorn) serve the current assets as well
+setup_dashboard_assets()
+precompile_templates()
+
+
+if __name__ == '__main__':
     print(f"Starting Serena Dashboard on http://localhost:24287")
     print(f"Dashboard interface: http://localhost:24287/dashboard/")
     
     try:
-        app.run(host='0.0.0.0', port=24287, debug=True)
+        if DEBUG:
+            # Werkzeug's dev server provides the code reloader and interactive debugger
+            app.run(host='0.0.0.0', port=24287, debug=True, use_reloader=True)
+        else:
+            import uvicorn
+
+            uvicorn.run(asgi_app, host='0.0.0.0', port=24287, log_level='info', workers=1, loop='auto')  # uvloop where available (not on Windows)
     except Exception as e:
         logger.error(f"Failed to start dashboard: {e}")
         sys.exit(1)
\ No newline at end of file
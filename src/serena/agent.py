@@ -4,9 +4,12 @@ Serena Agent - Core agent implementation
 """
 
 import os
+import stat
 import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 from sensai.util import logging
@@ -17,8 +20,29 @@ from serena.util.exception import SerenaException
 
 log = logging.getLogger(__name__)
 
+# Seconds for which the result of `SerenaAgent.get_project_info` is reused
+PROJECT_INFO_CACHE_TTL = 5.0
 
-@dataclass
+# Tools that are always available
+DEFAULT_TOOLS: Tuple[str, ...] = (
+    "find_symbol",
+    "get_symbols_overview",
+    "find_referencing_symbols",
+    "search_for_pattern",
+    "list_dir",
+    "find_file"
+)
+
+# Tools enabled by each mode
+MODE_TOOLS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "interactive": ("ask_user", "show_message"),
+    "editing": ("edit_symbol", "create_file", "delete_file"),
+    "analysis": ("analyze_code", "generate_report"),
+    "monitoring": ("watch_files", "track_changes")
+})
+
+
+@dataclass(slots=True)
 class SerenaConfig:
     """Configuration for Serena agent."""
     project_path: Optional[str] = None
@@ -31,6 +55,8 @@ class SerenaConfig:
 class SerenaAgent:
     """Main Serena agent class."""
     
+    __slots__ = ("config", "project_path", "context", "modes", "tool_registry", "_project_info_cache")
+    
     def __init__(self, config: SerenaConfig):
         """
         Initialize the Serena agent.
@@ -42,6 +68,8 @@ class SerenaAgent:
         self.context = config.context
         self.modes = config.modes
         self.tool_registry = ToolRegistry()
+        # (time of the check, mtime of the project path, project info)
+        self._project_info_cache: Optional[Tuple[float, Optional[float], Dict[str, Any]]] = None
         
         # Initialize the agent
         self._initialize()
@@ -56,17 +84,14 @@ class SerenaAgent:
         if not project_path:
             return None
         
-        path = Path(project_path)
-        if not path.is_absolute():
-            path = Path.cwd() / path
-        
-        return path.resolve()
+        # realpath resolves relative paths against the working directory itself
+        return Path(os.path.realpath(project_path))
     
     def _initialize(self) -> None:
         """
         Initialize the agent with tools and configuration.
         """
-        log.info(f"Initializing Serena agent for project: {self.project_path}")
+        log.info("Initializing Serena agent for project: %s", self.project_path)
         
         # Load tools based on modes
         self._load_tools()
@@ -74,77 +99,22 @@ class SerenaAgent:
         # Apply configuration
         self._apply_configuration()
         
-        log.info(f"Agent initialized with {len(self.tool_registry.tools)} tools")
+        log.info("Agent initialized with %d tools", len(self.tool_registry.tools))
     
     def _load_tools(self) -> None:
         """
-        Load tools based on the configured modes.
+        Load the default tools, the tools of the configured modes and the explicitly configured tools.
         """
-        # Load default tools
-        self._load_default_tools()
-        
-        # Load mode-specific tools
+        tool_names = set(DEFAULT_TOOLS)
         for mode in self.modes:
-            self._load_mode_tools(mode)
-        
-        # Load explicitly configured tools
-        for tool_name in self.config.tools:
-            self._load_tool(tool_name)
-    
-    def _load_default_tools(self) -> None:
-        """
-        Load default tools that are always available.
-        """
-        default_tools = [
-            "find_symbol",
-            "get_symbols_overview",
-            "find_referencing_symbols",
-            "search_for_pattern",
-            "list_dir",
-            "find_file"
-        ]
-        
-        for tool_name in default_tools:
-            try:
-                self._load_tool(tool_name)
-            except Exception as e:
-                log.warning(f"Failed to load default tool {tool_name}: {e}")
-    
-    def _load_mode_tools(self, mode: SerenaAgentMode) -> None:
-        """
-        Load tools specific to a mode.
-        
-        :param mode: The mode to load tools for
-        """
-        mode_tools = {
-            "interactive": ["ask_user", "show_message"],
-            "editing": ["edit_symbol", "create_file", "delete_file"],
-            "analysis": ["analyze_code", "generate_report"],
-            "monitoring": ["watch_files", "track_changes"]
-        }
-        
-        tools = mode_tools.get(mode.name, [])
-        for tool_name in tools:
-            try:
-                self._load_tool(tool_name)
-            except Exception as e:
-                log.warning(f"Failed to load mode tool {tool_name} for mode {mode.name}: {e}")
-    
-    def _load_tool(self, tool_name: str) -> None:
-        """
-        Load a specific tool.
-        
-        :param tool_name: Name of the tool to load
-        """
-        try:
-            tool = self.tool_registry.get_tool(tool_name)
-            if tool:
-                log.debug(f"Loaded tool: {tool_name}")
-            else:
-                log.warning(f"Tool not found: {tool_name}")
-        except Exception as e:
-            log.error(f"Failed to load tool {tool_name}: {e}")
-            raise SerenaException(f"Failed to load tool {tool_name}: {e}")
+            tool_names.update(MODE_TOOLS.get(mode.name, ()))
+        tool_names.update(self.config.tools)
+        
+        found, missing = self.tool_registry.get_tools(tool_names)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Loaded tools: %s", ", ".join(sorted(found)))
+        if missing:
+            log.warning("Tools not found: %s", ", ".join(sorted(missing)))
     
     def _apply_configuration(self) -> None:
         """
@@ -152,15 +122,15 @@ class SerenaAgent:
         """
         # Apply context settings
         if self.context:
-            log.debug(f"Applying context: {self.context.name}")
+            log.debug("Applying context: %s", self.context.name)
         
         # Apply mode settings
         for mode in self.modes:
-            log.debug(f"Applying mode: {mode.name}")
+            log.debug("Applying mode: %s", mode.name)
         
         # Apply custom settings
         for key, value in self.config.settings.items():
-            log.debug(f"Applying setting: {key} = {value}")
+            log.debug("Applying setting: %s = %s", key, value)
     
     def get_available_tools(self) -> List[Tool]:
         """
@@ -178,35 +148,57 @@ class SerenaAgent:
         :param kwargs: Tool parameters
         :return: Tool execution result
         """
-        tool = self.tool_registry.get_tool(tool_name)
-        if not tool:
-            raise SerenaException(f"Tool not found: {tool_name}")
+        try:
+            tool = self.tool_registry.tools[tool_name]
+        except KeyError:
+            raise SerenaException(f"Tool not found: {tool_name}") from None
         
         try:
-            log.debug(f"Executing tool: {tool_name} with args: {kwargs}")
+            log.debug("Executing tool: %s with args: %s", tool_name, kwargs)
             result = tool.execute(self, **kwargs)
-            log.debug(f"Tool {tool_name} completed successfully")
+            log.debug("Tool %s completed successfully", tool_name)
             return result
-        except Exception as e:
-            log.error(f"Tool {tool_name} failed: {e}")
-            raise SerenaException(f"Tool {tool_name} failed: {e}")
+        except (AttributeError, TypeError, ValueError, SerenaException) as e:
+            log.error("Tool %s failed: %s", tool_name, e)
+            raise SerenaException(f"Tool {tool_name} failed") from e
     
     def get_project_info(self) -> Dict[str, Any]:
         """
         Get information about the current project.
+        The information is cached for a few seconds; the returned dictionary is a copy which the caller may modify.
         
         :return: Project information dictionary
         """
         if not self.project_path:
             return {"project_path": None, "exists": False}
         
-        return {
-            "project_path": str(self.project_path),
-            "exists": self.project_path.exists(),
-            "is_directory": self.project_path.is_dir(),
-            "name": self.project_path.name,
-            "parent": str(self.project_path.parent)
-        }
+        now = time.monotonic()
+        cache = self._project_info_cache
+        if cache is not None and now - cache[0] < PROJECT_INFO_CACHE_TTL:
+            return dict(cache[2])
+        
+        try:
+            st = os.stat(self.project_path)
+            mtime: Optional[float] = st.st_mtime
+            exists = True
+            is_dir = stat.S_ISDIR(st.st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            mtime = None
+            exists = False
+            is_dir = False
+        
+        if cache is not None and cache[1] == mtime:
+            info = cache[2]
+        else:
+            info = {
+                "project_path": str(self.project_path),
+                "exists": exists,
+                "is_directory": is_dir,
+                "name": self.project_path.name,
+                "parent": str(self.project_path.parent)
+            }
+        self._project_info_cache = (now, mtime, info)
+        return dict(info)
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -219,7 +211,7 @@ class SerenaAgent:
             "context": self.context.name if self.context else None,
             "modes": [mode.name for mode in self.modes],
             "tools_count": len(self.tool_registry.tools),
-            "available_tools": [tool.name for tool in self.get_available_tools()]
+            "available_tools": list(self.tool_registry.tool_names)
         }
     
     def shutdown(self) -> None:
@@ -234,6 +226,6 @@ class SerenaAgent:
                 if hasattr(tool, 'cleanup'):
                     tool.cleanup()
             except Exception as e:
-                log.warning(f"Error cleaning up tool {tool.name}: {e}")
+                log.warning("Error cleaning up tool %s: %s", tool.name, e)
         
         log.info("Agent shutdown complete")
\ No newline at end of file
@@ -3,22 +3,19 @@
 Serena CLI - Command Line Interface for the Serena coding agent toolkit
 """
 
-import glob
-import json
+import functools
 import os
 import subprocess
 import sys
+from importlib.metadata import EntryPoint, entry_points
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import click
 from sensai.util import logging
 
-from serena.agent import SerenaAgent, SerenaConfig
-from serena.config.context_mode import SerenaAgentContext, SerenaAgentMode
 from serena.constants import DEFAULT_CONTEXT, DEFAULT_MODES, SERENA_LOG_FORMAT
-from serena.util.exception import show_fatal_exception_safe
-from serena.util.logging import MemoryLogHandler
+from serena.util import json as serena_json
 
 log = logging.getLogger(__name__)
 
@@ -45,18 +42,34 @@ class ProjectType(click.ParamType):
 
 
 class AutoRegisteringGroup(click.Group):
-    """A click group that automatically registers commands from modules."""
+    """
+    A click group that additionally provides the commands registered by installed packages under the
+    `serena.commands` entry point group. A plugin command's module is only imported when the command is invoked.
+    """
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._auto_register_commands()
+    ENTRY_POINT_GROUP = "serena.commands"
     
-    def _auto_register_commands(self) -> None:
-        """Automatically register commands from the commands module."""
-        try:
-            from serena.commands import *  # noqa: F403, F401
-        except ImportError:
-            pass  # Commands module not available
+    @staticmethod
+    @functools.cache
+    def _plugin_entry_points() -> Dict[str, EntryPoint]:
+        """Map the names of plugin commands to their entry points."""
+        return {ep.name: ep for ep in entry_points(group=AutoRegisteringGroup.ENTRY_POINT_GROUP)}
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            entry_point = self._plugin_entry_points().get(cmd_name)
+            if entry_point is not None:
+                try:
+                    command = entry_point.load()
+                except ImportError as e:
+                    log.warning(f"Failed to load command {cmd_name} from {entry_point.value}: {e}")
+                    return None
+                self.add_command(command, cmd_name)
+        return command
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | self._plugin_entry_points().keys())
 
 
 @click.group(cls=AutoRegisteringGroup)
@@ -125,12 +138,8 @@ def init(project: Optional[str], context: str) -> None:
         project = os.getcwd()
     
     project_path = Path(project).resolve()
-    
-    if not project_path.exists():
-        project_path.mkdir(parents=True, exist_ok=True)
-    
     config_file = project_path / ".serena" / "config.json"
-    config_file.parent.mkdir(exist_ok=True)
+    config_file.parent.mkdir(parents=True, exist_ok=True)
     
     config = {
         "project_name": project_path.name,
@@ -140,11 +149,13 @@ def init(project: Optional[str], context: str) -> None:
         "created_at": str(Path().ctime())
     }
     
-    with open(config_file, "w") as f:
-        json.dump(config, f, indent=2)
+    with open(config_file, "wb") as f:
+        f.write(serena_json.dumps(config))
     
-    click.echo(f"Initialized Serena project in {project_path}")
-    click.echo(f"Configuration saved to {config_file}")
+    click.echo(
+        f"Initialized Serena project in {project_path}\n"
+        f"Configuration saved to {config_file}"
+    )
 
 
 @cli.command()
@@ -165,6 +176,10 @@ def init(project: Optional[str], context: str) -> None:
 )
 def start(project: Optional[str], context: str, mode: List[str]) -> None:
     """Start the Serena agent."""
+    from serena.agent import SerenaAgent, SerenaConfig
+    from serena.config.context_mode import SerenaAgentContext, SerenaAgentMode
+    from serena.util.exception import show_fatal_exception_safe
+
     try:
         if not project:
             project = os.getcwd()
@@ -182,19 +197,47 @@ def start(project: Optional[str], context: str, mode: List[str]) -> None:
         # Create and start agent
         agent = SerenaAgent(config)
         
-        click.echo(f"Starting Serena agent for project: {project}")
-        click.echo(f"Context: {context}")
-        click.echo(f"Modes: {[m.name for m in modes]}")
-        
         # This would start the agent in interactive mode
         # For now, just show that it's configured
-        click.echo("Agent configured successfully!")
+        click.echo(
+            f"Starting Serena agent for project: {project}\n"
+            f"Context: {context}\n"
+            f"Modes: {[m.name for m in modes]}\n"
+            "Agent configured successfully!"
+        )
         
     except Exception as e:
         show_fatal_exception_safe(e)
         sys.exit(1)
 
 
+def _show_status(project: Optional[str]) -> None:
+    """Print the status of the Serena project in the given directory (default: the working directory)."""
+    if not project:
+        project = os.getcwd()
+    
+    project_path = Path(project).resolve()
+    config_file = project_path / ".serena" / "config.json"
+    
+    try:
+        with open(config_file, "rb") as f:
+            config = serena_json.loads(f.read())
+    except (FileNotFoundError, NotADirectoryError):
+        click.echo(
+            f"No Serena project found in {project_path}\n"
+            "Run 'serena init' to initialize a project."
+        )
+        return
+    
+    click.echo(
+        f"Project: {config.get('project_name', 'Unknown')}\n"
+        f"Path: {config.get('project_path', project_path)}\n"
+        f"Context: {config.get('context', 'Unknown')}\n"
+        f"Modes: {', '.join(config.get('modes', []))}\n"
+        f"Created: {config.get('created_at', 'Unknown')}"
+    )
+
+
 @cli.command()
 @click.option(
     "--project", "-p",
@@ -203,26 +246,49 @@ def start(project: Optional[str], context: str, mode: List[str]) -> None:
 )
 def status(project: Optional[str]) -> None:
     """Show the status of a Serena project."""
-    if not project:
-        project = os.getcwd()
-    
-    project_path = Path(project).resolve()
-    config_file = project_path / ".serena" / "config.json"
+    _show_status(project)
+
+
+# Commands that _fast_dispatch can run without going through click
+_FAST_COMMANDS = frozenset({"version", "status"})
+
+
+def _fast_dispatch(argv: List[str]) -> bool:
+    """
+    Run simple invocations of the `version` and `status` commands directly, bypassing click's parsing.
+    Anything else (help requests, unknown or malformed options) is left to click.
     
-    if not config_file.exists():
-        click.echo(f"No Serena project found in {project_path}")
-        click.echo("Run 'serena init' to initialize a project.")
-        return
+    :param argv: The command line arguments, including the program name
+    :return: True if the command was handled, False if it must be dispatched by click
+    """
+    if len(argv) < 2 or argv[1] not in _FAST_COMMANDS:
+        return False
+    command, args = argv[1], argv[2:]
     
-    with open(config_file) as f:
-        config = json.load(f)
+    if command == "version":
+        if args:
+            return False
+        from serena import serena_version
+        print(f"Serena {serena_version()}")
+        return True
     
-    click.echo(f"Project: {config.get('project_name', 'Unknown')}")
-    click.echo(f"Path: {config.get('project_path', project_path)}")
-    click.echo(f"Context: {config.get('context', 'Unknown')}")
-    click.echo(f"Modes: {', '.join(config.get('modes', []))}")
-    click.echo(f"Created: {config.get('created_at', 'Unknown')}")
+    if not args:
+        project = None
+    elif len(args) == 2 and args[0] in ("--project", "-p"):
+        project = args[1]
+    elif len(args) == 1 and args[0].startswith("--project="):
+        project = args[0][len("--project="):]
+    else:
+        return False
+    _show_status(project)
+    return True
+
+
+def main() -> None:
+    """Entry point of the `serena` command."""
+    if not _fast_dispatch(sys.argv):
+        cli()
 
 
 if __name__ == "__main__":
-    cli()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -4,17 +4,105 @@ Serena Configuration - Configuration management for Serena
 """
 
 import os
-import json
+import stat
+import sys
+import copy
+import functools
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
 from sensai.util import logging
 
+from serena.util import json as serena_json
+
 log = logging.getLogger(__name__)
 
+@functools.cache
+def _serena_home_dir() -> str:
+    """
+    :return: the path of the ~/.serena directory (computed once)
+    """
+    return os.path.join(os.path.expanduser("~"), ".serena")
+
+
+def _default_dir(env_var: str, name: str) -> str:
+    """
+    :param env_var: Environment variable which overrides the directory
+    :param name: Name of the directory within ~/.serena, which is used if the environment variable is not set
+    :return: the default path of the directory
+    """
+    return os.environ.get(env_var) or os.path.join(_serena_home_dir(), name)
+
+
+@functools.cache
+def _umask() -> int:
+    """
+    :return: the process umask (read once, since it can only be read by setting it)
+    """
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# path -> (mtime_ns, parsed content) of configuration files read or written by this process
+_json_cache: Dict[str, Tuple[int, Any]] = {}
+
+
+def _read_json_cached(path: Path) -> Any:
+    """
+    Read a JSON file, reusing the previously parsed content if the file has not been modified since.
+    The returned object is shared with the cache and must not be mutated.
+    
+    :param path: Path of the JSON file
+    :return: Parsed content
+    :raises FileNotFoundError: If the file does not exist
+    """
+    key = str(path)
+    mtime_ns = os.stat(key).st_mtime_ns
+    cached = _json_cache.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(key, 'rb') as f:
+        data = serena_json.loads(f.read())
+    _json_cache[key] = (mtime_ns, data)
+    return data
+
+
+def _write_json_cached(path: Path, data: Any) -> None:
+    """
+    Atomically write a JSON file (via a uniquely named temporary file that replaces it) and record the written content in the cache.
+    
+    :param path: Path of the JSON file
+    :param data: Content to write; it may share mutable values with live objects, so the cache
+        stores an independent copy parsed from the written document
+    """
+    key = str(path)
+    content = serena_json.dumps(data)
+    # a unique temporary file, such that concurrent writers do not interfere; the last replace wins
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(key), prefix=os.path.basename(key) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        # mkstemp creates the file readable by its owner only; keep the mode of the replaced file instead
+        try:
+            mode = stat.S_IMODE(os.stat(key).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, key)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _json_cache[key] = (os.stat(key).st_mtime_ns, serena_json.loads(content))
+
 
-@dataclass
+@dataclass(slots=True)
 class SerenaSettings:
     """Global Serena settings."""
     log_level: str = "INFO"
@@ -23,35 +111,73 @@ class SerenaSettings:
     max_log_size: int = 10 * 1024 * 1024  # 10MB
     cache_dir: Optional[str] = None
     temp_dir: Optional[str] = None
+    # the directories derived in __post_init__ (None if given explicitly); derived values are not persisted
+    _derived_cache_dir: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _derived_temp_dir: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        # explicit values take precedence over environment variables, which take precedence over ~/.serena
         if self.cache_dir is None:
-            self.cache_dir = str(Path.home() / ".serena" / "cache")
+            self.cache_dir = self._derived_cache_dir = _default_dir("SERENA_CACHE_DIR", "cache")
         if self.temp_dir is None:
-            self.temp_dir = str(Path.home() / ".serena" / "temp")
+            self.temp_dir = self._derived_temp_dir = _default_dir("SERENA_TEMP_DIR", "temp")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: the settings as a dictionary for serialization; directories which were derived (and not changed
+            since) are stored as None, such that they are derived anew (from the environment) when the settings are loaded
+        """
+        return {
+            "log_level": self.log_level,
+            "log_format": self.log_format,
+            "max_log_files": self.max_log_files,
+            "max_log_size": self.max_log_size,
+            "cache_dir": None if self.cache_dir == self._derived_cache_dir else self.cache_dir,
+            "temp_dir": None if self.temp_dir == self._derived_temp_dir else self.temp_dir
+        }
+
 
+# Default patterns of ProjectConfig (interned); each instance gets its own mutable copy of the list
+_PROJECT_IGNORE_PATTERNS = tuple(map(sys.intern, (
+    "*.pyc", "__pycache__", ".git", ".svn", "node_modules", ".venv", "venv"
+)))
+_PROJECT_INCLUDE_PATTERNS = tuple(map(sys.intern, (
+    "*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.c", "*.h", "*.cs", "*.go", "*.rs"
+)))
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Project-specific configuration."""
     name: str
     path: str
     language: Optional[str] = None
     frameworks: List[str] = field(default_factory=list)
-    ignore_patterns: List[str] = field(default_factory=lambda: [
-        "*.pyc", "__pycache__", ".git", ".svn", "node_modules", ".venv", "venv"
-    ])
-    include_patterns: List[str] = field(default_factory=lambda: [
-        "*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.c", "*.h", "*.cs", "*.go", "*.rs"
-    ])
+    ignore_patterns: List[str] = field(default_factory=lambda: list(_PROJECT_IGNORE_PATTERNS))
+    include_patterns: List[str] = field(default_factory=lambda: list(_PROJECT_INCLUDE_PATTERNS))
     custom_settings: Dict[str, Any] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: the configuration as a dictionary for serialization; unlike `dataclasses.asdict`,
+            the list and dict values are not copied but shared with this instance
+        """
+        return {
+            "name": self.name,
+            "path": self.path,
+            "language": self.language,
+            "frameworks": self.frameworks,
+            "ignore_patterns": self.ignore_patterns,
+            "include_patterns": self.include_patterns,
+            "custom_settings": self.custom_settings
+        }
 
 
 class ConfigManager:
     """Configuration manager for Serena."""
     
     def __init__(self, config_dir: Optional[str] = None):
-        self.config_dir = Path(config_dir) if config_dir else Path.home() / ".serena"
+        self.config_dir = Path(config_dir if config_dir else _serena_home_dir())
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
         self.settings_file = self.config_dir / "settings.json"
@@ -59,6 +185,11 @@ class ConfigManager:
         
         self._settings: Optional[SerenaSettings] = None
         self._projects: Dict[str, ProjectConfig] = {}
+        # resolved project path -> project configuration, for lookups by path
+        self._by_resolved_path: Dict[str, ProjectConfig] = {}
+        # while batching, project changes are only marked as dirty and written once the batch ends
+        self._batch_depth = 0
+        self._dirty = False
         
         self._load_configuration()
     
@@ -73,45 +204,50 @@ class ConfigManager:
         """
         Load global settings.
         """
-        if self.settings_file.exists():
-            try:
-                with open(self.settings_file, 'r') as f:
-                    data = json.load(f)
-                self._settings = SerenaSettings(**data)
-                log.debug(f"Loaded settings from {self.settings_file}")
-            except Exception as e:
-                log.warning(f"Failed to load settings: {e}")
-                self._settings = SerenaSettings()
-        else:
+        try:
+            data = _read_json_cached(self.settings_file)
+            self._settings = SerenaSettings(**data)
+            log.debug(f"Loaded settings from {self.settings_file}")
+        except FileNotFoundError:
             self._settings = SerenaSettings()
             self._save_settings()
+        except Exception as e:
+            log.warning(f"Failed to load settings: {e}")
+            self._settings = SerenaSettings()
     
     def _load_projects(self) -> None:
         """
         Load project configurations.
         """
-        if self.projects_file.exists():
-            try:
-                with open(self.projects_file, 'r') as f:
-                    data = json.load(f)
-                self._projects = {
-                    name: ProjectConfig(**config) 
-                    for name, config in data.items()
-                }
-                log.debug(f"Loaded {len(self._projects)} projects from {self.projects_file}")
-            except Exception as e:
-                log.warning(f"Failed to load projects: {e}")
-                self._projects = {}
-        else:
+        try:
+            data = _read_json_cached(self.projects_file)
+            # deep-copy the values (custom settings may be nested), since the parsed data is shared with the cache
+            self._projects = {
+                name: ProjectConfig(**copy.deepcopy(config))
+                for name, config in data.items()
+            }
+            log.debug(f"Loaded {len(self._projects)} projects from {self.projects_file}")
+        except FileNotFoundError:
             self._projects = {}
+        except Exception as e:
+            log.warning(f"Failed to load projects: {e}")
+            self._projects = {}
+        self._rebuild_path_index()
+    
+    def _rebuild_path_index(self) -> None:
+        """
+        Rebuild the index of projects by resolved path.
+        """
+        self._by_resolved_path = {}
+        for config in self._projects.values():
+            self._by_resolved_path.setdefault(os.path.realpath(config.path), config)
     
     def _save_settings(self) -> None:
         """
         Save global settings to file.
         """
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(asdict(self._settings), f, indent=2)
+            _write_json_cached(self.settings_file, self._settings.to_dict())
             log.debug(f"Saved settings to {self.settings_file}")
         except Exception as e:
             log.error(f"Failed to save settings: {e}")
@@ -121,13 +257,43 @@ class ConfigManager:
         Save project configurations to file.
         """
         try:
-            data = {name: asdict(config) for name, config in self._projects.items()}
-            with open(self.projects_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = {name: config.to_dict() for name, config in self._projects.items()}
+            _write_json_cached(self.projects_file, data)
             log.debug(f"Saved {len(self._projects)} projects to {self.projects_file}")
         except Exception as e:
             log.error(f"Failed to save projects: {e}")
     
+    def _projects_changed(self) -> None:
+        """
+        Persist changed project configurations, deferring the write if a batch is active.
+        """
+        if self._batch_depth > 0:
+            self._dirty = True
+        else:
+            self._save_projects()
+    
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """
+        Context manager which defers writing project changes until the (outermost) batch ends,
+        such that multiple additions/removals result in a single write.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write pending project changes to file.
+        """
+        if self._dirty:
+            self._dirty = False
+            self._save_projects()
+    
     def get_settings(self) -> SerenaSettings:
         """
         Get global settings.
@@ -163,8 +329,13 @@ class ConfigManager:
         
         :param config: Project configuration
         """
+        replaced = self._projects.get(config.name)
         self._projects[config.name] = config
-        self._save_projects()
+        if replaced is None:
+            self._by_resolved_path.setdefault(os.path.realpath(config.path), config)
+        else:
+            self._rebuild_path_index()
+        self._projects_changed()
         log.info(f"Added/updated project: {config.name}")
     
     def remove_project(self, name: str) -> bool:
@@ -176,7 +347,8 @@ class ConfigManager:
         """
         if name in self._projects:
             del self._projects[name]
-            self._save_projects()
+            self._rebuild_path_index()
+            self._projects_changed()
             log.info(f"Removed project: {name}")
             return True
         return False
@@ -196,11 +368,7 @@ class ConfigManager:
         :param path: Project path
         :return: Project configuration or None
         """
-        path = str(Path(path).resolve())
-        for config in self._projects.values():
-            if str(Path(config.path).resolve()) == path:
-                return config
-        return None
+        return self._by_resolved_path.get(os.path.realpath(path))
     
     def create_project_config(self, name: str, path: str, **kwargs) -> ProjectConfig:
         """
@@ -216,20 +384,15 @@ class ConfigManager:
         return config
 
 
-# Global configuration manager instance
-_global_config_manager: Optional[ConfigManager] = None
-
-
+@functools.cache
 def get_config_manager() -> ConfigManager:
     """
-    Get the global configuration manager.
+    Get the global configuration manager, which is created on first use.
+    Use `get_config_manager.cache_clear()` to discard it (e.g. in tests).
     
     :return: Global configuration manager instance
     """
-    global _global_config_manager
-    if _global_config_manager is None:
-        _global_config_manager = ConfigManager()
-    return _global_config_manager
+    return ConfigManager()
 
 
 def get_settings() -> SerenaSettings:
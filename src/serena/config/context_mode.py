@@ -3,17 +3,21 @@
 Serena Context and Mode Configuration
 """
 
-import json
+import copy
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 from sensai.util import logging
 
+from serena.util import json as serena_json
+
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SerenaAgentContext:
     """Agent context configuration."""
     name: str
@@ -22,6 +26,10 @@ class SerenaAgentContext:
     tools: List[str] = field(default_factory=list)
     memory_settings: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self) -> None:
+        # names are compared and used as lookup keys frequently
+        object.__setattr__(self, "name", sys.intern(self.name))
+    
     @classmethod
     def load(cls, context: Union[str, 'SerenaAgentContext']) -> 'SerenaAgentContext':
         """
@@ -33,54 +41,44 @@ class SerenaAgentContext:
         if isinstance(context, cls):
             return context
         
-        # Try to load from built-in contexts
-        builtin_contexts = {
-            "default": cls(
-                name="default",
-                description="Default context with standard tools",
-                tools=["find_symbol", "get_symbols_overview", "search_for_pattern"],
-                settings={"max_results": 100, "timeout": 30}
-            ),
-            "minimal": cls(
-                name="minimal",
-                description="Minimal context with basic tools only",
-                tools=["find_symbol", "search_for_pattern"],
-                settings={"max_results": 50, "timeout": 15}
-            ),
-            "full": cls(
-                name="full",
-                description="Full context with all available tools",
-                tools=[],  # Empty means all tools
-                settings={"max_results": 500, "timeout": 60}
-            )
-        }
+        if context in _BUILTIN_CONTEXTS:
+            # the built-in instance has mutable settings/tools, so each caller gets its own copy
+            return copy.deepcopy(_BUILTIN_CONTEXTS[context])
         
-        if context in builtin_contexts:
-            return builtin_contexts[context]
-        
-        # Try to load from file
+        # Try to load from file (the suffix check avoids touching the filesystem for plain names)
         context_file = Path(context)
-        if context_file.exists() and context_file.suffix == '.json':
+        if context.endswith('.json') and os.path.isfile(context):
             try:
-                with open(context_file, 'r') as f:
-                    data = json.load(f)
+                with open(context_file, 'rb') as f:
+                    data = serena_json.loads(f.read())
                 return cls(**data)
             except Exception as e:
                 log.warning(f"Failed to load context from {context_file}: {e}")
         
         # Default fallback
         log.warning(f"Context '{context}' not found, using default")
-        return builtin_contexts["default"]
+        return copy.deepcopy(_BUILTIN_CONTEXTS["default"])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SerenaAgentMode:
     """Agent mode configuration."""
     name: str
     description: str = ""
-    enabled_tools: List[str] = field(default_factory=list)
-    disabled_tools: List[str] = field(default_factory=list)
+    # stored as tuples (lists are accepted), such that they cannot diverge from the sets below
+    enabled_tools: Tuple[str, ...] = ()
+    disabled_tools: Tuple[str, ...] = ()
     settings: Dict[str, Any] = field(default_factory=dict)
+    # set versions of enabled_tools/disabled_tools for fast membership tests
+    _enabled_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _disabled_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "enabled_tools", tuple(self.enabled_tools))
+        object.__setattr__(self, "disabled_tools", tuple(self.disabled_tools))
+        object.__setattr__(self, "_enabled_set", frozenset(self.enabled_tools))
+        object.__setattr__(self, "_disabled_set", frozenset(self.disabled_tools))
     
     @classmethod
     def load(cls, mode: Union[str, 'SerenaAgentMode']) -> 'SerenaAgentMode':
@@ -93,51 +91,23 @@ class SerenaAgentMode:
         if isinstance(mode, cls):
             return mode
         
-        # Try to load from built-in modes
-        builtin_modes = {
-            "interactive": cls(
-                name="interactive",
-                description="Interactive mode for user communication",
-                enabled_tools=["ask_user", "show_message"],
-                settings={"interactive": True, "auto_confirm": False}
-            ),
-            "editing": cls(
-                name="editing",
-                description="Editing mode for code modifications",
-                enabled_tools=["edit_symbol", "create_file", "delete_file"],
-                settings={"backup_files": True, "validate_syntax": True}
-            ),
-            "analysis": cls(
-                name="analysis",
-                description="Analysis mode for code inspection",
-                enabled_tools=["analyze_code", "generate_report"],
-                disabled_tools=["edit_symbol", "create_file", "delete_file"],
-                settings={"deep_analysis": True, "generate_metrics": True}
-            ),
-            "monitoring": cls(
-                name="monitoring",
-                description="Monitoring mode for watching changes",
-                enabled_tools=["watch_files", "track_changes"],
-                settings={"watch_interval": 1.0, "auto_refresh": True}
-            )
-        }
+        if mode in _BUILTIN_MODES:
+            # the built-in instance has mutable settings, so each caller gets its own copy
+            return copy.deepcopy(_BUILTIN_MODES[mode])
         
-        if mode in builtin_modes:
-            return builtin_modes[mode]
-        
-        # Try to load from file
+        # Try to load from file (the suffix check avoids touching the filesystem for plain names)
         mode_file = Path(mode)
-        if mode_file.exists() and mode_file.suffix == '.json':
+        if mode.endswith('.json') and os.path.isfile(mode):
             try:
-                with open(mode_file, 'r') as f:
-                    data = json.load(f)
+                with open(mode_file, 'rb') as f:
+                    data = serena_json.loads(f.read())
                 return cls(**data)
             except Exception as e:
                 log.warning(f"Failed to load mode from {mode_file}: {e}")
         
         # Default fallback
         log.warning(f"Mode '{mode}' not found, using interactive")
-        return builtin_modes["interactive"]
+        return copy.deepcopy(_BUILTIN_MODES["interactive"])
     
     def is_tool_enabled(self, tool_name: str) -> bool:
         """
@@ -146,10 +116,10 @@ class SerenaAgentMode:
         :param tool_name: Tool name
         :return: True if enabled, False otherwise
         """
-        if tool_name in self.disabled_tools:
+        if tool_name in self._disabled_set:
             return False
         
-        if self.enabled_tools and tool_name not in self.enabled_tools:
+        if self._enabled_set and tool_name not in self._enabled_set:
             return False
         
         return True
@@ -165,6 +135,57 @@ class SerenaAgentMode:
         return self.settings.get(key, default)
 
 
+# Built-in contexts and modes, created once; `load` returns copies of them
+_BUILTIN_CONTEXTS: Dict[str, SerenaAgentContext] = {
+    "default": SerenaAgentContext(
+        name="default",
+        description="Default context with standard tools",
+        tools=["find_symbol", "get_symbols_overview", "search_for_pattern"],
+        settings={"max_results": 100, "timeout": 30}
+    ),
+    "minimal": SerenaAgentContext(
+        name="minimal",
+        description="Minimal context with basic tools only",
+        tools=["find_symbol", "search_for_pattern"],
+        settings={"max_results": 50, "timeout": 15}
+    ),
+    "full": SerenaAgentContext(
+        name="full",
+        description="Full context with all available tools",
+        tools=[],  # Empty means all tools
+        settings={"max_results": 500, "timeout": 60}
+    )
+}
+
+_BUILTIN_MODES: Dict[str, SerenaAgentMode] = {
+    "interactive": SerenaAgentMode(
+        name="interactive",
+        description="Interactive mode for user communication",
+        enabled_tools=["ask_user", "show_message"],
+        settings={"interactive": True, "auto_confirm": False}
+    ),
+    "editing": SerenaAgentMode(
+        name="editing",
+        description="Editing mode for code modifications",
+        enabled_tools=["edit_symbol", "create_file", "delete_file"],
+        settings={"backup_files": True, "validate_syntax": True}
+    ),
+    "analysis": SerenaAgentMode(
+        name="analysis",
+        description="Analysis mode for code inspection",
+        enabled_tools=["analyze_code", "generate_report"],
+        disabled_tools=["edit_symbol", "create_file", "delete_file"],
+        settings={"deep_analysis": True, "generate_metrics": True}
+    ),
+    "monitoring": SerenaAgentMode(
+        name="monitoring",
+        description="Monitoring mode for watching changes",
+        enabled_tools=["watch_files", "track_changes"],
+        settings={"watch_interval": 1.0, "auto_refresh": True}
+    )
+}
+
+
 def create_context_file(name: str, context: SerenaAgentContext, output_dir: str = ".") -> Path:
     """
     Create a context configuration file.
@@ -184,8 +205,8 @@ def create_context_file(name: str, context: SerenaAgentContext, output_dir: str
         "memory_settings": context.memory_settings
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(serena_json.dumps(data))
     
     log.info(f"Created context file: {output_path}")
     return output_path
@@ -210,8 +231,8 @@ def create_mode_file(name: str, mode: SerenaAgentMode, output_dir: str = ".") ->
         "settings": mode.settings
     }
     
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(serena_json.dumps(data))
     
     log.info(f"Created mode file: {output_path}")
     return output_path
\ No newline at end of file
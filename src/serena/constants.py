@@ -3,6 +3,11 @@
 Serena Constants - Global constants and configuration values
 """
 
+import fnmatch
+import os
+import re
+from typing import Dict, Optional
+
 # Version information
 SERENA_VERSION = "0.1.4"
 SERENA_NAME = "Serena"
@@ -14,10 +19,10 @@ SERENA_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 # Default configuration
 DEFAULT_CONTEXT = "default"
-DEFAULT_MODES = ["interactive", "editing"]
+DEFAULT_MODES = ("interactive", "editing")
 
 # File patterns
-DEFAULT_IGNORE_PATTERNS = [
+DEFAULT_IGNORE_PATTERNS = (
     "*.pyc",
     "__pycache__",
     ".git",
@@ -35,9 +40,9 @@ DEFAULT_IGNORE_PATTERNS = [
     "*.swp",
     "*.swo",
     "*~"
-]
+)
 
-DEFAULT_INCLUDE_PATTERNS = [
+DEFAULT_INCLUDE_PATTERNS = (
     "*.py",
     "*.js",
     "*.ts",
@@ -94,7 +99,27 @@ DEFAULT_INCLUDE_PATTERNS = [
     "*.sbt",
     "*.cabal",
     "*.nix"
-]
+)
+
+# The default patterns compiled into one regular expression each, so that matching a name is a single regex match
+_IGNORE_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in DEFAULT_IGNORE_PATTERNS))
+_INCLUDE_RE = re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in DEFAULT_INCLUDE_PATTERNS))
+
+
+def is_ignored(name: str) -> bool:
+    """
+    :param name: File or directory name
+    :return: whether the name matches one of DEFAULT_IGNORE_PATTERNS
+    """
+    return _IGNORE_RE.match(name) is not None
+
+
+def is_included(name: str) -> bool:
+    """
+    :param name: File name
+    :return: whether the name matches one of DEFAULT_INCLUDE_PATTERNS
+    """
+    return _INCLUDE_RE.match(name) is not None
 
 # Language detection patterns
 LANGUAGE_PATTERNS = {
@@ -140,15 +165,44 @@ LANGUAGE_PATTERNS = {
     "nix": ["*.nix"]
 }
 
+# Reverse lookup tables derived from LANGUAGE_PATTERNS: lower-case extension -> language and exact file name -> language.
+# Where several languages share a pattern, the first one in LANGUAGE_PATTERNS wins.
+_EXT_TO_LANG: Dict[str, str] = {}
+_EXACT_NAME_TO_LANG: Dict[str, str] = {}
+for _language, _patterns in LANGUAGE_PATTERNS.items():
+    for _pattern in _patterns:
+        if _pattern.startswith("*."):
+            _EXT_TO_LANG.setdefault(_pattern[1:].lower(), _language)
+        else:
+            _EXACT_NAME_TO_LANG.setdefault(_pattern, _language)
+del _language, _patterns, _pattern
+
+
+def detect_language(filename: str) -> Optional[str]:
+    """
+    Detect the language of a file based on LANGUAGE_PATTERNS.
+
+    :param filename: File name or path
+    :return: Language name or None if the file does not match any language
+    """
+    basename = os.path.basename(filename)
+    # unlike os.path.splitext, this treats the whole name of dot files (e.g. ".py") as extension, as "*.py" does
+    _, dot, ext = basename.rpartition(".")
+    if dot:
+        language = _EXT_TO_LANG.get("." + ext.lower())
+        if language is not None:
+            return language
+    return _EXACT_NAME_TO_LANG.get(basename)
+
 # Tool categories
 TOOL_CATEGORIES = {
-    "search": ["find_symbol", "search_for_pattern", "find_file"],
-    "analysis": ["get_symbols_overview", "find_referencing_symbols", "analyze_code"],
-    "editing": ["edit_symbol", "create_file", "delete_file"],
-    "navigation": ["list_dir", "find_file"],
-    "reporting": ["generate_report"],
-    "interaction": ["ask_user", "show_message"],
-    "monitoring": ["watch_files", "track_changes"]
+    "search": frozenset({"find_symbol", "search_for_pattern", "find_file"}),
+    "analysis": frozenset({"get_symbols_overview", "find_referencing_symbols", "analyze_code"}),
+    "editing": frozenset({"edit_symbol", "create_file", "delete_file"}),
+    "navigation": frozenset({"list_dir", "find_file"}),
+    "reporting": frozenset({"generate_report"}),
+    "interaction": frozenset({"ask_user", "show_message"}),
+    "monitoring": frozenset({"watch_files", "track_changes"})
 }
 
 # Memory and performance settings
@@ -173,7 +227,8 @@ API_ENDPOINTS = {
     "agents": "/api/agents",
     "projects": "/api/projects",
     "logs": "/api/logs",
-    "metrics": "/api/metrics"
+    "metrics": "/api/metrics",
+    "overview": "/api/overview"
 }
 
 # Error messages
@@ -4,11 +4,12 @@ The Serena Model Context Protocol (MCP) Server
 """
 
 import sys
+import weakref
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import asynccontextmanager
+import copy
 import functools
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Literal, cast
 
@@ -26,6 +27,7 @@ from serena.agent import (
 from serena.config.context_mode import SerenaAgentContext, SerenaAgentMode
 from serena.constants import DEFAULT_CONTEXT, DEFAULT_MODES, SERENA_LOG_FORMAT
 from serena.tools import Tool
+from serena.util import json as serena_json
 from serena.util.exception import show_fatal_exception_safe
 from serena.util.logging import MemoryLogHandler
 
@@ -43,8 +45,48 @@ def configure_logging(*args, **kwargs) -> None:  # type: ignore
 # patch the logging configuration function in fastmcp, because it's hard-coded and broken
 server.configure_logging = configure_logging  # type: ignore
 
+# keys of JSON Schema nodes whose values are traversed by `SerenaMCPFactory._sanitize_for_openai_tools`
+_NESTED_SCHEMA_KEYS = frozenset(("properties", "additionalProperties", "items"))
+_COMBINATOR_KEYS = frozenset(("oneOf", "anyOf", "allOf"))
 
-@dataclass
+
+@functools.lru_cache(maxsize=32)
+def _load_context_cached(context: str) -> SerenaAgentContext:
+    return SerenaAgentContext.load(context)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_mode_cached(mode: str) -> SerenaAgentMode:
+    return SerenaAgentMode.load(mode)
+
+
+def _load_context(context: str) -> SerenaAgentContext:
+    """
+    Load a context by name or file path, reusing previously loaded contexts instead of reading files again.
+    Changes to a context file are therefore only picked up by new processes.
+    
+    :param context: The context name or path to context file
+    :return: A copy of the cached context, whose mutable settings the caller may modify
+    """
+    return copy.deepcopy(_load_context_cached(context))
+
+
+def _load_mode(mode: str) -> SerenaAgentMode:
+    """
+    Load a mode by name or file path, reusing previously loaded modes instead of reading files again.
+    Changes to a mode file are therefore only picked up by new processes.
+    
+    :param mode: The mode name or path to mode file
+    :return: A copy of the cached mode, whose mutable settings the caller may modify
+    """
+    return copy.deepcopy(_load_mode_cached(mode))
+
+
+# tool -> (schema string of the tool, OpenAI-compatible schema derived from it); see `_get_openai_schema`
+_openai_schemas: "weakref.WeakKeyDictionary[Tool, tuple[str, dict]]" = weakref.WeakKeyDictionary()
+
+
+@dataclass(frozen=True, slots=True)
 class SerenaMCPRequestContext:
     """Context for MCP requests."""
     agent: SerenaAgent
@@ -62,11 +104,19 @@ class SerenaMCPFactory:
             If the project passed here hasn't been registered yet, it will be registered automatically and can be activated by its name
             afterward.
         """
-        self.context = SerenaAgentContext.load(context)
+        self.context = _load_context(context)
         self.project = project
 
     @staticmethod
-    @functools.lru_cache(maxsize=None)
+    @functools.lru_cache(maxsize=256)
+    def _canonicalize_schema_json(schema_json: str) -> str:
+        """
+        :param schema_json: JSON document
+        :return: the document in canonical form (sorted keys, compact separators), matching `Tool.get_schema`
+        """
+        return serena_json.dumps_canonical(serena_json.loads(schema_json))
+
+    @staticmethod
     def _sanitize_for_openai_tools(schema_json: str) -> dict:
         """
         Make a Pydantic/JSON Schema object compatible with OpenAI tool schema.
@@ -77,28 +127,53 @@ class SerenaMCPFactory:
         - remove 'null' from union type arrays
         - coerce integer-only enums to number
         - best-effort simplify oneOf/anyOf when they only differ by integer/number
+        
+        The results of at most 256 schemas are cached, keyed by the canonical form of the JSON string, such that
+        schemas which differ only in key order or whitespace share an entry. Since results are cached,
+        the returned dict is shared between callers and must not be mutated.
         """
-        import json
+        return SerenaMCPFactory._sanitize_canonical(SerenaMCPFactory._canonicalize_schema_json(schema_json))
 
-        schema = json.loads(schema_json)
-        s = deepcopy(schema)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _sanitize_canonical(schema_json: str) -> dict:
+        """
+        Implements `_sanitize_for_openai_tools` for a canonical JSON string.
+        The parsed schema is a fresh tree which is sanitized in place.
+        """
+        s = serena_json.loads(schema_json)
 
-        def walk(node):  # type: ignore
-            if not isinstance(node, dict):
-                # lists get handled by parent calls
-                return node
+        # Nodes are visited with an explicit stack rather than recursively; the type/enum handling is applied
+        # on visit (parents before children), the oneOf/anyOf simplification afterwards in reverse visiting
+        # order, such that it sees the already sanitized children (as it would after recursing into them).
+        # Parsed JSON only contains exact dict/list/str/... instances, so types are checked by identity.
+        _type, _dict, _list, _str, _int = type, dict, list, str, int
+        # Parsing creates a separate string object for every type value; interning them lets all cached
+        # schemas share one object per type name (like the literals written below, which are interned already).
+        _intern = sys.intern
+        stack: list = [s]
+        visited: list[dict] = []
+        while stack:
+            node = stack.pop()
+            if _type(node) is not _dict:
+                continue
+            visited.append(node)
 
             # ---- handle type ----
+            # most nodes have a single type string other than "integer", which is handled by the first two checks
             t = node.get("type")
-            if isinstance(t, str):
+            t_type = _type(t)
+            if t_type is _str:
                 if t == "integer":
                     node["type"] = "number"
                     # preserve existing multipleOf but ensure it's integer-like
                     if "multipleOf" not in node:
                         node["multipleOf"] = 1
-            elif isinstance(t, list):
+                else:
+                    node["type"] = _intern(t)
+            elif t_type is _list:
                 # remove 'null' (OpenAI tools don't support nullables)
-                t2 = [x if x != "integer" else "number" for x in t if x != "null"]
+                t2 = [_intern(x) if x != "integer" else "number" for x in t if x != "null"]
                 if not t2:
                     # fall back to object if it somehow becomes empty
                     t2 = ["object"]
@@ -108,46 +183,63 @@ class SerenaMCPFactory:
                     if "multipleOf" not in node:
                         node["multipleOf"] = 1
 
-            # ---- handle enum ----
+            # ---- handle enum (rare) ----
             enum_vals = node.get("enum")
-            if enum_vals and isinstance(enum_vals, list):
+            if enum_vals and _type(enum_vals) is _list:
                 # if all enum values are integers, convert to numbers
-                if all(isinstance(v, int) for v in enum_vals):
+                if all(isinstance(v, _int) for v in enum_vals):
                     node["enum"] = [float(v) for v in enum_vals]
                     if node.get("type") == "integer":
                         node["type"] = "number"
                         if "multipleOf" not in node:
                             node["multipleOf"] = 1
 
-            # ---- recursively handle nested structures ----
+            # ---- schedule nested structures ----
             for key, value in node.items():
-                if key in ["properties", "additionalProperties", "items"]:
-                    if isinstance(value, dict):
-                        walk(value)
-                    elif isinstance(value, list):
-                        for item in value:
-                            walk(item)
-                elif key in ["oneOf", "anyOf", "allOf"]:
-                    if isinstance(value, list):
-                        for item in value:
-                            walk(item)
-                        # attempt to simplify oneOf/anyOf that only differ by integer/number
-                        if key in ["oneOf", "anyOf"] and len(value) == 2:
-                            types = [item.get("type") for item in value]
-                            if set(types) == {"integer", "number"}:
-                                # merge into a single number type
-                                merged = deepcopy(value[0])
-                                merged["type"] = "number"
-                                if "multipleOf" not in merged:
-                                    merged["multipleOf"] = 1
-                                node.pop(key)
-                                node.update(merged)
-
-            return node
-
-        walk(s)
+                if key in _NESTED_SCHEMA_KEYS:
+                    value_type = _type(value)
+                    if value_type is _dict:
+                        stack.append(value)
+                    elif value_type is _list:
+                        stack.extend(value)
+                elif key in _COMBINATOR_KEYS and _type(value) is _list:
+                    stack.extend(value)
+
+        # ---- attempt to simplify oneOf/anyOf that only differ by integer/number ----
+        for node in reversed(visited):
+            for key in ("oneOf", "anyOf"):
+                value = node.get(key)
+                if isinstance(value, _list) and len(value) == 2:
+                    types = [item.get("type") for item in value]
+                    if set(types) == {"integer", "number"}:
+                        # merge into a single number type
+                        # value is removed from the node, so its first entry can be reused directly
+                        merged = value[0]
+                        merged["type"] = "number"
+                        if "multipleOf" not in merged:
+                            merged["multipleOf"] = 1
+                        node.pop(key)
+                        node.update(merged)
+
         return s
 
+    @classmethod
+    def _get_openai_schema(cls, tool: Tool) -> dict:
+        """
+        Get the OpenAI-compatible schema of a tool, which is computed once per tool and reused
+        for as long as the tool's schema string is unchanged (i.e. no parameter was added).
+        
+        :param tool: The Serena tool
+        :return: The sanitized schema (shared, must not be mutated)
+        """
+        schema_json = tool.get_schema()
+        cached = _openai_schemas.get(tool)
+        if cached is not None and cached[0] is schema_json:
+            return cached[1]
+        schema = cls._sanitize_for_openai_tools(schema_json)
+        _openai_schemas[tool] = (schema_json, schema)
+        return schema
+
     def create_mcp_server(
         self,
         name: str = "serena",
@@ -163,7 +255,7 @@ class SerenaMCPFactory:
         :return: FastMCP server instance
         """
         # Create the agent configuration
-        modes = [SerenaAgentMode.load(mode) for mode in DEFAULT_MODES]
+        modes = [_load_mode(mode) for mode in DEFAULT_MODES]
         config = SerenaConfig(
             project_path=self.project,
             context=self.context,
@@ -210,31 +302,25 @@ class SerenaMCPFactory:
         :return: MCP tool wrapper
         """
         # Get tool schema
-        schema = tool.get_schema()
+        schema = self._get_openai_schema(tool) if openai_tool_compatible else tool.get_schema()
         
-        if openai_tool_compatible:
-            schema = self._sanitize_for_openai_tools(schema)
+        # The request context only holds the agent, so a single instance is shared by all calls of the tool
+        context = SerenaMCPRequestContext(agent=agent)
+        # bound once, such that calls do not look up the attributes again
+        execute = tool.execute
+        tool_name = tool.name
         
         # Create the MCP tool
-        @mcp.tool(name=tool.name, description=tool.description)
+        # (the try block is free on Python 3.11+ unless an exception is raised)
+        @mcp.tool(name=tool_name, description=tool.description)
         async def mcp_tool_wrapper(**kwargs) -> str:
             """MCP tool wrapper."""
             try:
-                # Create request context
-                context = SerenaMCPRequestContext(agent=agent)
-                
-                # Execute the tool
-                result = await tool.execute(context, **kwargs)
-                
-                # Return result as string
-                if isinstance(result, str):
-                    return result
-                else:
-                    return str(result)
-                    
+                result = await execute(context, **kwargs)
+                return result if result.__class__ is str else str(result)
             except Exception as e:
-                log.error(f"Error executing tool {tool.name}: {e}")
-                return f"Error: {str(e)}"
+                log.error("Error executing tool %s: %s", tool_name, e)
+                return f"Error: {e}"
         
         return mcp_tool_wrapper
 
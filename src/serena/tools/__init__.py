@@ -4,16 +4,29 @@ Serena Tools - Tool registry and base classes
 """
 
 import inspect
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass
 
 from sensai.util import logging
 
+from serena.util import json as serena_json
+
 log = logging.getLogger(__name__)
 
+# JSON schema types of Python parameter types; other types are represented as strings
+_JSON_TYPE_MAP: Dict[Type, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object"
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolParameter:
     """Tool parameter definition."""
     name: str
@@ -23,6 +36,12 @@ class ToolParameter:
     default: Any = None
 
 
+# (name, type, required, default) of a parameter, as unpacked by `Tool.validate_parameters`
+_ParameterSpec = Tuple[str, Type, bool, Any]
+
+_MISSING = object()
+
+
 class Tool(ABC):
     """Base class for all Serena tools."""
     
@@ -30,6 +49,12 @@ class Tool(ABC):
         self.name = name
         self.description = description
         self._parameters: List[ToolParameter] = []
+        # serialized schema, built on first use and invalidated whenever a parameter is added
+        self._schema_cache: Optional[str] = None
+        # read-only view of the parameters, materialized on first use and invalidated whenever a parameter is added
+        self._params_tuple: Optional[Tuple[ToolParameter, ...]] = None
+        # flattened parameter attributes for validation, in parameter order
+        self._param_specs: List[_ParameterSpec] = []
     
     @abstractmethod
     async def execute(self, context: Any, **kwargs) -> Any:
@@ -49,43 +74,56 @@ class Tool(ABC):
         :param param: Parameter to add
         """
         self._parameters.append(param)
+        self._schema_cache = None
+        self._params_tuple = None
+        self._param_specs.append((param.name, param.type, param.required, param.default))
     
     def get_parameters(self) -> List[ToolParameter]:
         """
-        Get tool parameters.
+        Get tool parameters as a new list, which the caller may modify.
+        Use `parameters` for read-only access without copying.
         
         :return: List of tool parameters
         """
         return self._parameters.copy()
     
+    @property
+    def parameters(self) -> Tuple[ToolParameter, ...]:
+        """
+        The tool parameters as an immutable tuple, which is reused until a parameter is added.
+        """
+        if self._params_tuple is None:
+            self._params_tuple = tuple(self._parameters)
+        return self._params_tuple
+    
     def get_schema(self) -> str:
         """
-        Get tool schema as JSON string.
+        Get tool schema as canonical JSON string (sorted keys, compact separators), such that equal schemas
+        yield equal strings. The string is built once and reused until a parameter is added.
         
         :return: JSON schema string
         """
-        import json
+        if self._schema_cache is not None:
+            return self._schema_cache
         
         schema = {
             "name": self.name,
             "description": self.description,
             "parameters": {
                 "type": "object",
-                "properties": {},
-                "required": []
+                "properties": {
+                    param.name: {
+                        "type": _JSON_TYPE_MAP.get(param.type, "string"),
+                        "description": param.description
+                    }
+                    for param in self._parameters
+                },
+                "required": [param.name for param in self._parameters if param.required]
             }
         }
         
-        for param in self._parameters:
-            schema["parameters"]["properties"][param.name] = {
-                "type": self._get_json_type(param.type),
-                "description": param.description
-            }
-            
-            if param.required:
-                schema["parameters"]["required"].append(param.name)
-        
-        return json.dumps(schema)
+        self._schema_cache = serena_json.dumps_canonical(schema)
+        return self._schema_cache
     
     def _get_json_type(self, python_type: Type) -> str:
         """
@@ -94,16 +132,7 @@ class Tool(ABC):
         :param python_type: Python type
         :return: JSON schema type string
         """
-        type_mapping = {
-            str: "string",
-            int: "integer",
-            float: "number",
-            bool: "boolean",
-            list: "array",
-            dict: "object"
-        }
-        
-        return type_mapping.get(python_type, "string")
+        return _JSON_TYPE_MAP.get(python_type, "string")
     
     def validate_parameters(self, **kwargs) -> Dict[str, Any]:
         """
@@ -113,35 +142,61 @@ class Tool(ABC):
         :return: Validated parameters
         :raises ValueError: If validation fails
         """
-        validated = {}
-        
-        for param in self._parameters:
-            if param.name in kwargs:
-                value = kwargs[param.name]
-                # Basic type checking
-                if not isinstance(value, param.type):
-                    try:
-                        value = param.type(value)
-                    except (ValueError, TypeError):
-                        raise ValueError(f"Parameter {param.name} must be of type {param.type.__name__}")
-                validated[param.name] = value
-            elif param.required:
-                if param.default is not None:
-                    validated[param.name] = param.default
-                else:
-                    raise ValueError(f"Required parameter {param.name} is missing")
-            elif param.default is not None:
-                validated[param.name] = param.default
-        
+        validated: Dict[str, Any] = {}
+        for name, param_type, required, default in self._param_specs:
+            value = kwargs.get(name, _MISSING)
+            if value is _MISSING:
+                if default is not None:
+                    validated[name] = default
+                elif required:
+                    raise ValueError(f"Required parameter {name} is missing")
+                continue
+            # Basic type checking; the exact type check is a fast path for the common case
+            if type(value) is not param_type and not isinstance(value, param_type):
+                try:
+                    value = param_type(value)
+                except (ValueError, TypeError):
+                    raise ValueError(f"Parameter {name} must be of type {param_type.__name__}")
+            validated[name] = value
         return validated
 
 
+# (name, description) of the built-in tools
+_BUILTIN_TOOLS: Tuple[Tuple[str, str], ...] = (
+    ("find_symbol", "Find symbols in the codebase"),
+    ("get_symbols_overview", "Get overview of symbols in a file"),
+    ("find_referencing_symbols", "Find symbols that reference a given symbol"),
+    ("search_for_pattern", "Search for patterns in the codebase"),
+    ("list_dir", "List directory contents"),
+    ("find_file", "Find files in the project"),
+    ("edit_symbol", "Edit a symbol in the codebase"),
+    ("create_file", "Create a new file"),
+    ("delete_file", "Delete a file"),
+    ("analyze_code", "Analyze code quality and structure"),
+    ("generate_report", "Generate analysis reports")
+)
+
+
 class ToolRegistry:
     """Registry for managing tools."""
     
+    __slots__ = ("_tools", "_tool_names")
+    
     def __init__(self):
-        self.tools: Dict[str, Tool] = {}
-        self._load_builtin_tools()
+        # registered tools by name; the built-in tools are loaded on first access (see `tools`)
+        self._tools: Optional[Dict[str, Tool]] = None
+        # names of the registered tools, computed on first use and invalidated when the registered tools change
+        self._tool_names: Optional[Tuple[str, ...]] = None
+    
+    @property
+    def tools(self) -> Dict[str, Tool]:
+        """
+        The registered tools by name, starting with the built-in tools, which are loaded on first access.
+        """
+        if self._tools is None:
+            self._tools = {}
+            self._load_builtin_tools()
+        return self._tools
     
     def _load_builtin_tools(self) -> None:
         """
@@ -149,24 +204,8 @@ class ToolRegistry:
         """
         # This would load actual tool implementations
         # For now, we'll create placeholder tools
-        
-        builtin_tools = [
-            ("find_symbol", "Find symbols in the codebase"),
-            ("get_symbols_overview", "Get overview of symbols in a file"),
-            ("find_referencing_symbols", "Find symbols that reference a given symbol"),
-            ("search_for_pattern", "Search for patterns in the codebase"),
-            ("list_dir", "List directory contents"),
-            ("find_file", "Find files in the project"),
-            ("edit_symbol", "Edit a symbol in the codebase"),
-            ("create_file", "Create a new file"),
-            ("delete_file", "Delete a file"),
-            ("analyze_code", "Analyze code quality and structure"),
-            ("generate_report", "Generate analysis reports")
-        ]
-        
-        for name, description in builtin_tools:
-            tool = PlaceholderTool(name, description)
-            self.register_tool(tool)
+        for name, description in _BUILTIN_TOOLS:
+            self.register_tool(PlaceholderTool(name, description))
     
     def register_tool(self, tool: Tool) -> None:
         """
@@ -174,7 +213,9 @@ class ToolRegistry:
         
         :param tool: Tool to register
         """
-        self.tools[tool.name] = tool
+        # interned names let lookups with interned strings (e.g. literals) match by identity
+        self.tools[sys.intern(tool.name)] = tool
+        self._tool_names = None
         log.debug(f"Registered tool: {tool.name}")
     
     def unregister_tool(self, name: str) -> None:
@@ -185,8 +226,18 @@ class ToolRegistry:
         """
         if name in self.tools:
             del self.tools[name]
+            self._tool_names = None
             log.debug(f"Unregistered tool: {name}")
     
+    @property
+    def tool_names(self) -> Tuple[str, ...]:
+        """
+        Names of all registered tools, cached until a tool is registered or unregistered.
+        """
+        if self._tool_names is None:
+            self._tool_names = tuple(self.tools)
+        return self._tool_names
+    
     def get_tool(self, name: str) -> Optional[Tool]:
         """
         Get a tool by name.
@@ -196,6 +247,24 @@ class ToolRegistry:
         """
         return self.tools.get(name)
     
+    def get_tools(self, names: Iterable[str]) -> Tuple[Dict[str, Tool], List[str]]:
+        """
+        Get multiple tools by name in a single call.
+        
+        :param names: Tool names
+        :return: Tuple of (found tools by name, names of tools that are not registered)
+        """
+        tools = self.tools
+        found: Dict[str, Tool] = {}
+        missing: List[str] = []
+        for name in names:
+            tool = tools.get(name)
+            if tool is None:
+                missing.append(name)
+            else:
+                found[name] = tool
+        return found, missing
+    
     def list_tools(self) -> List[str]:
         """
         List all registered tool names.
@@ -0,0 +1,69 @@
+"""
+JSON serialization helpers, backed by orjson if it is installed and by the standard library otherwise
+"""
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson
+
+    # runs of 20+ digits, which may be integers beyond the 64-bit range that orjson parses as floats
+    _LONG_DIGITS_BYTES = re.compile(rb"\d{20}")
+    _LONG_DIGITS_STR = re.compile(r"\d{20}")
+
+    def loads(data: bytes | str) -> Any:
+        """
+        :param data: JSON document
+        :return: the parsed object
+        """
+        long_digits = _LONG_DIGITS_BYTES if isinstance(data, (bytes, bytearray)) else _LONG_DIGITS_STR
+        if long_digits.search(data) is not None:
+            # the standard library preserves arbitrarily large integers
+            return json.loads(data)
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """
+        :param obj: object to serialize
+        :return: the JSON document (indented by two spaces) as UTF-8 bytes
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers exceeding 64 bits, which only the standard library supports
+            return json.dumps(obj, indent=2).encode()
+
+    def dumps_canonical(obj: Any) -> str:
+        """
+        :param obj: object to serialize
+        :return: the canonical JSON document (sorted keys, compact separators, non-ASCII characters unescaped)
+        """
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+except ImportError:
+
+    def loads(data: bytes | str) -> Any:
+        """
+        :param data: JSON document
+        :return: the parsed object
+        """
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """
+        :param obj: object to serialize
+        :return: the JSON document (indented by two spaces) as UTF-8 bytes
+        """
+        return json.dumps(obj, indent=2).encode()
+
+    def dumps_canonical(obj: Any) -> str:
+        """
+        :param obj: object to serialize
+        :return: the canonical JSON document (sorted keys, compact separators, non-ASCII characters unescaped)
+        """
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
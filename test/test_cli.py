@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import serena
+from serena.cli import _fast_dispatch
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    config_dir = tmp_path / ".serena"
+    config_dir.mkdir()
+    (config_dir / "config.json").write_text(json.dumps({
+        "project_name": "demo",
+        "project_path": str(tmp_path),
+        "context": "default",
+        "modes": ["interactive", "editing"],
+        "created_at": "now"
+    }))
+    return tmp_path
+
+
+class TestFastDispatch:
+    def test_version(self, monkeypatch, capsys):
+        monkeypatch.setattr(serena, "serena_version", lambda: "1.2.3")
+        assert _fast_dispatch(["serena", "version"])
+        assert capsys.readouterr().out == "Serena 1.2.3\n"
+
+    @pytest.mark.parametrize("args", [["-p", "{}"], ["--project", "{}"], ["--project={}"]])
+    def test_status_with_project(self, project_dir, capsys, args):
+        assert _fast_dispatch(["serena", "status"] + [arg.format(project_dir) for arg in args])
+        out = capsys.readouterr().out
+        assert "Project: demo" in out
+        assert "Modes: interactive, editing" in out
+
+    def test_status_defaults_to_working_directory(self, project_dir, monkeypatch, capsys):
+        monkeypatch.chdir(project_dir)
+        assert _fast_dispatch(["serena", "status"])
+        assert "Project: demo" in capsys.readouterr().out
+
+    def test_status_without_project(self, tmp_path, capsys):
+        assert _fast_dispatch(["serena", "status", "-p", str(tmp_path)])
+        assert "No Serena project found" in capsys.readouterr().out
+
+    def test_status_of_a_file(self, tmp_path, capsys):
+        file_path = tmp_path / "some_file.txt"
+        file_path.write_text("")
+        assert _fast_dispatch(["serena", "status", "-p", str(file_path)])
+        assert "No Serena project found" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("argv", [
+        ["serena"],
+        ["serena", "init"],
+        ["serena", "--verbose", "status"],
+        ["serena", "version", "--help"],
+        ["serena", "status", "--help"],
+        ["serena", "status", "-p"],
+        ["serena", "status", "-x", "path"],
+        ["serena", "status", "-p", "a", "b"],
+    ])
+    def test_leaves_other_invocations_to_click(self, argv, capsys):
+        assert not _fast_dispatch(argv)
+        assert capsys.readouterr().out == ""
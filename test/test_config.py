@@ -0,0 +1,118 @@
+import os
+import stat
+
+import pytest
+
+import serena.config as serena_config
+from serena.config import ConfigManager, ProjectConfig, SerenaSettings, _read_json_cached, _write_json_cached
+
+
+@pytest.fixture
+def write_count(monkeypatch) -> list:
+    """Records the paths written via _write_json_cached."""
+    written = []
+    original = serena_config._write_json_cached
+
+    def counting_write(path, data):
+        written.append(path)
+        original(path, data)
+
+    monkeypatch.setattr(serena_config, "_write_json_cached", counting_write)
+    return written
+
+
+class TestConfigManagerBatch:
+    def test_writes_each_change_without_batch(self, tmp_path, write_count):
+        cm = ConfigManager(str(tmp_path))
+        write_count.clear()
+        cm.create_project_config("a", str(tmp_path))
+        cm.create_project_config("b", str(tmp_path))
+        assert write_count == [cm.projects_file, cm.projects_file]
+
+    def test_batch_coalesces_writes(self, tmp_path, write_count):
+        cm = ConfigManager(str(tmp_path))
+        write_count.clear()
+        with cm.batch():
+            cm.create_project_config("a", str(tmp_path))
+            cm.create_project_config("b", str(tmp_path))
+            cm.remove_project("a")
+            assert write_count == []
+        assert write_count == [cm.projects_file]
+        assert ConfigManager(str(tmp_path)).list_projects() == ["b"]
+
+    def test_nested_batches_write_once_at_the_end(self, tmp_path, write_count):
+        cm = ConfigManager(str(tmp_path))
+        write_count.clear()
+        with cm.batch():
+            with cm.batch():
+                cm.create_project_config("a", str(tmp_path))
+            assert write_count == []
+            cm.create_project_config("b", str(tmp_path))
+        assert write_count == [cm.projects_file]
+
+    def test_batch_without_changes_does_not_write(self, tmp_path, write_count):
+        cm = ConfigManager(str(tmp_path))
+        write_count.clear()
+        with cm.batch():
+            pass
+        assert write_count == []
+
+    def test_flush_writes_pending_changes(self, tmp_path, write_count):
+        cm = ConfigManager(str(tmp_path))
+        write_count.clear()
+        with cm.batch():
+            cm.create_project_config("a", str(tmp_path))
+            cm.flush()
+            assert write_count == [cm.projects_file]
+        # nothing is pending anymore when the batch ends
+        assert write_count == [cm.projects_file]
+
+
+class TestJsonCache:
+    def test_unchanged_file_is_not_parsed_again(self, tmp_path):
+        path = tmp_path / "data.json"
+        _write_json_cached(path, {"a": 1})
+        assert _read_json_cached(path) is _read_json_cached(path)
+
+    def test_modified_file_is_reread(self, tmp_path):
+        path = tmp_path / "data.json"
+        _write_json_cached(path, {"a": 1})
+        assert _read_json_cached(path) == {"a": 1}
+        mtime_ns = os.stat(path).st_mtime_ns
+        path.write_text('{"a": 2}')
+        # make sure the modification is visible even on file systems with coarse timestamps
+        os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        assert _read_json_cached(path) == {"a": 2}
+
+    def test_loaded_projects_do_not_share_state_with_the_cache(self, tmp_path):
+        cm = ConfigManager(str(tmp_path))
+        cm.create_project_config("p", str(tmp_path), custom_settings={"a": {"b": 1}})
+        ConfigManager(str(tmp_path)).get_project("p").custom_settings["a"]["b"] = 99
+        assert ConfigManager(str(tmp_path)).get_project("p").custom_settings == {"a": {"b": 1}}
+
+    def test_write_replaces_file_and_keeps_its_mode(self, tmp_path):
+        path = tmp_path / "data.json"
+        _write_json_cached(path, {"a": 1})
+        os.chmod(path, 0o640)
+        _write_json_cached(path, {"a": 2})
+        assert _read_json_cached(path) == {"a": 2}
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+        assert os.listdir(tmp_path) == ["data.json"]
+
+    def test_non_string_keys_are_written(self, tmp_path):
+        cm = ConfigManager(str(tmp_path))
+        cm.add_project(ProjectConfig(name="p", path=str(tmp_path), custom_settings={1: "x"}))
+        assert ConfigManager(str(tmp_path)).get_project("p").custom_settings == {"1": "x"}
+
+
+class TestSerenaSettingsDirectories:
+    def test_derived_directories_follow_the_environment(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("SERENA_CACHE_DIR", raising=False)
+        ConfigManager(str(tmp_path))
+        monkeypatch.setenv("SERENA_CACHE_DIR", str(tmp_path / "cache"))
+        assert ConfigManager(str(tmp_path)).get_settings().cache_dir == str(tmp_path / "cache")
+
+    def test_explicit_directories_are_persisted(self, monkeypatch):
+        monkeypatch.setenv("SERENA_CACHE_DIR", "/from/env")
+        assert SerenaSettings(cache_dir="/from/env").to_dict()["cache_dir"] == "/from/env"
+        assert SerenaSettings().to_dict()["cache_dir"] is None
@@ -0,0 +1,63 @@
+import fnmatch
+from typing import Optional
+
+from serena.constants import (
+    DEFAULT_IGNORE_PATTERNS,
+    DEFAULT_INCLUDE_PATTERNS,
+    LANGUAGE_PATTERNS,
+    detect_language,
+    is_ignored,
+    is_included,
+)
+
+
+def _language_by_fnmatch(name: str) -> Optional[str]:
+    """Reference implementation: the first language with a matching pattern (extensions match case-insensitively)."""
+    for language, patterns in LANGUAGE_PATTERNS.items():
+        for pattern in patterns:
+            if pattern.startswith("*."):
+                if fnmatch.fnmatchcase(name.lower(), pattern.lower()):
+                    return language
+            elif fnmatch.fnmatchcase(name, pattern):
+                return language
+    return None
+
+
+def _sample_names(patterns) -> list:
+    names = ["", "README", "noext.", ".hidden", "a.b.c", "archive.tar.gz"]
+    for pattern in patterns:
+        for name in (pattern.replace("*", "file"), pattern.replace("*", ""), pattern.replace("*", "x.y")):
+            names += [name, name.upper(), name.lower(), name + "2", "prefix" + name]
+    return names
+
+
+_LANGUAGE_SAMPLES = _sample_names([p for patterns in LANGUAGE_PATTERNS.values() for p in patterns])
+
+
+class TestDetectLanguage:
+    def test_matches_fnmatch(self):
+        mismatches = {name: detect_language(name) for name in _LANGUAGE_SAMPLES
+            if detect_language(name) != _language_by_fnmatch(name)}
+        assert mismatches == {}
+
+    def test_uses_the_base_name_of_paths(self):
+        assert detect_language("src/some.dir/CMakeLists.txt") == "cmake"
+        assert detect_language("src/some.dir/module.py") == "python"
+
+
+class TestPatternMatching:
+    def test_is_ignored_matches_fnmatch(self):
+        for name in _sample_names(DEFAULT_IGNORE_PATTERNS + DEFAULT_INCLUDE_PATTERNS):
+            expected = any(fnmatch.fnmatchcase(name, pattern) for pattern in DEFAULT_IGNORE_PATTERNS)
+            assert is_ignored(name) == expected, name
+
+    def test_is_included_matches_fnmatch(self):
+        for name in _sample_names(DEFAULT_IGNORE_PATTERNS + DEFAULT_INCLUDE_PATTERNS):
+            expected = any(fnmatch.fnmatchcase(name, pattern) for pattern in DEFAULT_INCLUDE_PATTERNS)
+            assert is_included(name) == expected, name
+
+    def test_names_are_matched_entirely(self):
+        assert is_ignored("node_modules")
+        assert not is_ignored("node_modules_backup")
+        assert not is_ignored("my.git")
+        assert not is_included("script.py.bak")